@@ -56,23 +56,8 @@ from qt_material import apply_stylesheet
 from speedy_qc.main_app import MainApp
 # from speedy_qc.wizard import ConfigurationWizard
 from speedy_qc.unified_wizard import ConfigurationWizard
-from speedy_qc.windows import LoadMessageBox, SetupWindow
-
-
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-else:
-    raise(FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
-
-resource_dir = os.path.normpath(resource_dir)
+from speedy_qc.windows import LoadMessageBox, SetupWindow, preload_images
+from speedy_qc.utils import resource_dir
 
 
 def qt_message_handler(mode, context, message):
@@ -150,6 +135,12 @@ def main(theme='qt_material', material_theme='dark_blue.xml', icon_theme='qtawes
     # Create the application
     app = QApplication(sys.argv)
 
+    # Room for the full-size logo pixmaps shared between the dialogs (limit in KB)
+    QPixmapCache.setCacheLimit(20_000)
+
+    # Decode the dialog logos in the background while the first dialog is built
+    preload_images()
+
     settings = QSettings('SpeedyQC', 'DicomViewer')
 
     # Set the application theme
@@ -201,15 +192,6 @@ def main(theme='qt_material', material_theme='dark_blue.xml', icon_theme='qtawes
 
         # User selects to `Conf. Wizard` -> show the ConfigurationWizard
         else:
-            if hasattr(sys, '_MEIPASS'):
-                # This is a py2app executable
-                resource_dir = sys._MEIPASS
-            elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-                # This is a regular Python script
-                resource_dir = os.path.dirname(os.path.abspath("__main__"))
-            else:
-                resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-            resource_dir = os.path.normpath(resource_dir)
             wizard = ConfigurationWizard(settings.value("last_config_file", os.path.join(resource_dir, "config.yml")))
             result = wizard.exec()
             if result == 1:
@@ -22,7 +22,6 @@ import datetime
 import json
 from typing import Dict, List, Tuple, Optional
 import matplotlib.pyplot as plt
-import sys
 from math import ceil
 import imageio as iio
 from functools import partial
@@ -31,23 +30,9 @@ import pandas as pd
 from speedy_qc.windows import AboutMessageBox, FileSelectionDialog
 from speedy_qc.utils import ConnectionManager, open_yml_file, setup_logging, bytescale, expand_dict_column
 from speedy_qc.utils import convert_to_checkstate, find_relative_image_path, invert_grayscale
+from speedy_qc.utils import resource_dir
 from speedy_qc.graphics import CustomGraphicsView, BoundingBoxItem, SignalMediator
 
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.listdir(os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-else:
-    raise(FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
-
-resource_dir = os.path.normpath(os.path.abspath(resource_dir))
-
 
 class ClickableWidget(QWidget):
     clicked = pyqtSignal()
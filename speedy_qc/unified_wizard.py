@@ -12,26 +12,108 @@ from PyQt6.QtWidgets import *
 import yaml
 import os
 from qt_material import apply_stylesheet, get_theme
-import sys
-from math import ceil
+import copy
+import hashlib
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 
-from speedy_qc.utils import open_yml_file, setup_logging, ConnectionManager, find_relative_image_path
-import json
+from speedy_qc.utils import open_yml_file, setup_logging, ConnectionManager, contains_image_file, SafeDumper
+from speedy_qc.utils import resource_dir, normalise_path, read_json_cached, file_signature
+from speedy_qc.windows import _scaled_pixmap
 
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-else:
-    raise (FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
+# Theme lookups parse the theme's XML file, so cache them process-wide
+get_theme = lru_cache(maxsize=8)(get_theme)
 
-resource_dir = os.path.normpath(os.path.abspath(resource_dir))
+
+@lru_cache(maxsize=8)
+def _theme_colours(theme_name: str) -> Dict[str, str]:
+    """
+    Returns the colours the wizard uses from a qt_material theme, falling back on related colours where the theme
+    does not define them.
+
+    :param theme_name: The qt_material theme, e.g. 'dark_blue.xml'.
+    :type theme_name: str
+    :return: The 'entry', 'disabled' and 'border' colours.
+    :rtype: Dict[str, str]
+    """
+    theme = get_theme(theme_name)
+    return {
+        'entry': theme.get('secondaryTextColor') or theme.get('secondaryLightColor'),
+        'disabled': theme.get('secondaryLightColor') or theme.get('primaryLightColor'),
+        'border': theme.get('secondaryLightColor') or theme.get('secondaryColor'),
+    }
+
+# Rules for the radio button groups, installed once in the wizard's stylesheet and matched by object name
+_GROUPBOX_QSS = "QGroupBox#rbGroup { margin-top: 0px; padding: 10px; }"
+_TITLE_QSS = "QLabel#rbTitle { font-weight: bold; text-transform: uppercase; }"
+
+
+def _config_digest(config_data: dict) -> bytes:
+    """
+    Returns a digest of the configuration data, used to tell whether it needs writing to disk.
+
+    :param config_data: The configuration data.
+    :type config_data: dict
+    :return: The digest of the YAML representation of the data.
+    :rtype: bytes
+    """
+    return hashlib.blake2b(yaml.dump(config_data, Dumper=SafeDumper).encode()).digest()
+
+
+# The .yml files in resource_dir, along with the directory's modification time when they were listed
+_YML_LISTING_CACHE = {'mtime': None, 'files': []}
+
+
+def _list_config_files() -> list:
+    """
+    Lists the .yml config files in the resource directory, only re-scanning it when it has been modified.
+
+    :return: The config file names.
+    :rtype: list
+    """
+    mtime = os.stat(resource_dir).st_mtime
+    if mtime != _YML_LISTING_CACHE['mtime']:
+        with os.scandir(resource_dir) as entries:
+            _YML_LISTING_CACHE['files'] = [
+                entry.name for entry in entries if entry.name.endswith('.yml') and entry.is_file()
+            ]
+        _YML_LISTING_CACHE['mtime'] = mtime
+    return _YML_LISTING_CACHE['files']
+
+
+# Stands in for a key that is absent from a config, as distinct from one set to None
+_MISSING = object()
+
+
+@lru_cache(maxsize=8)
+def _advanced_settings_qss(theme_name: str) -> str:
+    """
+    Returns the stylesheet for the advanced settings dialog, formatted once per theme.
+
+    :param theme_name: The qt_material theme, e.g. 'dark_blue.xml'.
+    :type theme_name: str
+    :return: The stylesheet.
+    :rtype: str
+    """
+    colours = _theme_colours(theme_name)
+    return f"""
+        QLineEdit, QSpinBox, QComboBox {{
+            color: {colours['entry']};
+        }}
+        QComboBox:disabled {{
+            color: {colours['disabled']};
+        }}
+        #ConfigFrame, #LogFrame, #BackupFrame {{
+            border: 2px solid {colours['border']};
+            border-radius: 5px;
+        }}
+        QLabel[role="title"] {{
+            font-weight: bold;
+        }}
+        QLabel[role="path"] {{
+            font-style: italic;
+        }}
+    """
 
 
 class AdvancedSettingsDialog(QDialog):
@@ -41,52 +123,31 @@ class AdvancedSettingsDialog(QDialog):
         self.wiz = unified_page_instance.wiz
         self.settings = unified_page_instance.settings
         self.connection_manager = unified_page_instance.connection_manager
-        self.log_dir = os.path.normpath(self.wiz.log_dir)
-        self.backup_dir = os.path.normpath(self.wiz.backup_dir)
+        self.log_dir = normalise_path(self.wiz.log_dir)
+        self.backup_dir = normalise_path(self.wiz.backup_dir)
         self.backup_interval = self.wiz.backup_interval
         self.max_backups = self.wiz.max_backups
         self.setWindowTitle("Advanced Settings")
 
-        try:
-            self.entry_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']
-        except KeyError:
-            self.entry_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryLightColor']
-        try:
-            self.disabled_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryLightColor']
-        except KeyError:
-            self.disabled_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['primaryLightColor']
-        try:
-            self.border_color = get_theme(self.settings.value("theme", 'dark_blue.xml'))['secondaryLightColor']
-        except KeyError:
-            self.border_color = get_theme(self.settings.value("theme", 'dark_blue.xml'))['secondaryColor']
+        theme_name = self.settings.value('theme', 'dark_blue.xml')
 
-        self.setStyleSheet(f"""
-            QLineEdit {{
-                color: {self.entry_colour};
-            }}
-            QSpinBox {{
-                color: {self.entry_colour};
-            }}
-            QComboBox {{
-                color: {self.entry_colour};
-            }}
-        """)
+        # One stylesheet for the whole dialog, so its widgets are polished once rather than one by one
+        self.setStyleSheet(_advanced_settings_qss(theme_name))
 
         self.layout = QVBoxLayout()
 
         config_frame = QFrame()
         config_frame.setObjectName("ConfigFrame")
-        config_frame.setStyleSheet(f"#ConfigFrame {{ border: 2px solid {self.border_color}; border-radius: 5px; }}")
         self.config_layout = QVBoxLayout()
         self.config_file_title = QLabel("Configuration File Settings:")
-        self.config_file_title.setStyleSheet("font-weight: bold;")
+        self.config_file_title.setProperty("role", "title")
         self.config_layout.addWidget(self.config_file_title)
 
         # Create QComboBox for the list of available .yml files
         self.config_files_combobox = QComboBox()
-        for file in os.listdir(resource_dir):
-            if file.endswith('.yml'):
-                self.config_files_combobox.addItem(file)
+        self._combobox_enabled = None
+        self.config_files = _list_config_files()
+        self.config_files_combobox.addItems(self.config_files)
 
         existing_combo_layout = QHBoxLayout()
         existing_combo_title = QLabel("Existing Configuration Files:")
@@ -110,8 +171,8 @@ class AdvancedSettingsDialog(QDialog):
         save_path_label = QLabel("Save directory:")
         save_path_layout.addWidget(save_path_label)
         save_dir_label = QLabel(resource_dir)
-        save_path_label.setStyleSheet("font-style: italic;")
-        save_dir_label.setStyleSheet("font-style: italic;")
+        save_path_label.setProperty("role", "path")
+        save_dir_label.setProperty("role", "path")
         save_path_layout.addWidget(save_dir_label)
         save_path_layout.addStretch()
         self.config_layout.addLayout(save_path_layout)
@@ -121,44 +182,64 @@ class AdvancedSettingsDialog(QDialog):
         self.layout.addWidget(config_frame)
         self.layout.addStretch()
 
+        # The log and backup sections are added once the dialog is showing
+        self.sections_layout = QVBoxLayout()
+        self.layout.addLayout(self.sections_layout)
+        self._sections_built = False
+        QTimer.singleShot(0, self._build_log_and_backup_sections)
+
+        # Add a "Back" button
+        back_button = QPushButton("Back")
+        self.connection_manager.connect(back_button.clicked, self.close)
+        self.layout.addWidget(back_button)
+
+        self.setLayout(self.layout)
+        self.setMinimumSize(400, 520)
+
+        QTimer.singleShot(0, self.update_config_combobox_state)
+
+    def _build_log_and_backup_sections(self):
+        """
+        Builds the log and backup settings frames, if this has not already been done.
+        """
+        if self._sections_built:
+            return
+        self._sections_built = True
+
         log_frame = QFrame()
         log_frame.setObjectName("LogFrame")
-        log_frame.setStyleSheet(f"#LogFrame {{ border: 2px solid {self.border_color}; border-radius: 5px; }}")
         self.log_layout = QVBoxLayout()
 
         # Create a widget for the log directory
         self.log_dir_title = QLabel("Log Settings:")
-        self.log_dir_title.setStyleSheet("font-weight: bold;")
+        self.log_dir_title.setProperty("role", "title")
         self.log_layout.addWidget(self.log_dir_title)
 
         self.log_dir_layout = QHBoxLayout()
         log_dir_label = QLabel("Log directory:")
         self.log_dir_edit = QLineEdit()
-        self.log_dir_edit.setText(self.settings.value("log_dir", os.path.normpath(os.path.expanduser(self.log_dir))))
+        self.log_dir_edit.setText(self.settings.value("log_dir", normalise_path(self.log_dir)))
         self.log_dir_layout.addWidget(log_dir_label)
         self.log_dir_layout.addWidget(self.log_dir_edit)
         self.log_layout.addLayout(self.log_dir_layout)
 
         log_frame.setLayout(self.log_layout)
-        self.layout.addWidget(log_frame)
-        self.layout.addStretch()
+        self.sections_layout.addWidget(log_frame)
+        self.sections_layout.addStretch()
 
         backup_frame = QFrame()
         backup_frame.setObjectName("BackupFrame")
-        backup_frame.setStyleSheet(f"#BackupFrame {{ border: 2px solid {self.border_color}; border-radius: 5px; }}")
         self.backup_layout = QVBoxLayout()
 
         # Create a widget for the log directory
         self.backup_title = QLabel("Backup Settings:")
-        self.backup_title.setStyleSheet("font-weight: bold;")
+        self.backup_title.setProperty("role", "title")
         self.backup_layout.addWidget(self.backup_title)
 
         backup_dir_layout = QHBoxLayout()
         backup_dir_label = QLabel("Backup directory:")
         self.backup_dir_edit = QLineEdit()
-        self.backup_dir_edit.setText(self.settings.value("backup_dir", os.path.normpath(
-            os.path.expanduser(self.backup_dir)
-        )))
+        self.backup_dir_edit.setText(self.settings.value("backup_dir", normalise_path(self.backup_dir)))
         backup_dir_layout.addWidget(backup_dir_label)
         backup_dir_layout.addWidget(self.backup_dir_edit)
         self.backup_layout.addLayout(backup_dir_layout)
@@ -185,40 +266,47 @@ class AdvancedSettingsDialog(QDialog):
         self.backup_layout.addLayout(backup_int_layout)
 
         backup_frame.setLayout(self.backup_layout)
-        self.layout.addWidget(backup_frame)
-        self.layout.addStretch()
+        self.sections_layout.addWidget(backup_frame)
+        self.sections_layout.addStretch()
 
-        # Add a "Back" button
-        back_button = QPushButton("Back")
-        self.connection_manager.connect(back_button.clicked, self.close)
-        self.layout.addWidget(back_button)
+    def refresh(self):
+        """
+        Re-reads the wizard's current settings into the dialog's fields so a reused dialog is not stale.
+        """
+        self._build_log_and_backup_sections()
+        self.log_dir = normalise_path(self.wiz.log_dir)
+        self.backup_dir = normalise_path(self.wiz.backup_dir)
+        self.backup_interval = self.wiz.backup_interval
+        self.max_backups = self.wiz.max_backups
 
-        self.setLayout(self.layout)
-        self.setMinimumSize(400, 520)
+        self.log_dir_edit.setText(self.log_dir)
+        self.backup_dir_edit.setText(self.backup_dir)
+        self.backup_spinbox.setValue(self.max_backups)
+        self.backup_int_spinbox.setValue(self.backup_interval)
 
-        QTimer.singleShot(0, self.update_config_combobox_state)
+        # Only rebuild the list of config files if the resource directory has changed
+        config_files = _list_config_files()
+        if config_files is not self.config_files:
+            current_file = self.config_files_combobox.currentText()
+            self.config_files = config_files
+            self.config_files_combobox.clear()
+            self.config_files_combobox.addItems(self.config_files)
+            self.config_files_combobox.setCurrentText(current_file)
+        self.update_config_combobox_state()
 
     def update_config_combobox_state(self):
         """
         Updates the QComboBox on the save page with the list of existing .yml files.
         """
-        if self.filename_edit.text():
-            self.config_files_combobox.setEnabled(False)
-        else:
-            self.config_files_combobox.setEnabled(True)
-        self.update_combobox_stylesheet()
-
-    def update_combobox_stylesheet(self):
-        """
-        Updates the stylesheet of the QComboBox on the save page to indicate whether it is
-        enabled or disabled.
-        """
-        if self.config_files_combobox.isEnabled():
-            self.config_files_combobox.setStyleSheet(f"QComboBox {{ color: {self.entry_colour}; }}")
-        else:
-            self.config_files_combobox.setStyleSheet(f"QComboBox {{ color: {self.disabled_colour}; }}")
+        # Called on every keystroke, so only touch the combobox when its state actually changes
+        enabled = not self.filename_edit.text()
+        if enabled == self._combobox_enabled:
+            return
+        self._combobox_enabled = enabled
+        self.config_files_combobox.setEnabled(enabled)
 
     def close(self):
+        self._build_log_and_backup_sections()
         # self.settings.setValue("log_dir", self.log_dir_edit.text())
         # self.settings.setValue("backup_dir", self.backup_dir_edit.text())
         # self.settings.setValue("max_backups", self.backup_spinbox.value())
@@ -228,8 +316,8 @@ class AdvancedSettingsDialog(QDialog):
             self.wiz.config_filename = self.filename_edit.text()
         else:
             self.wiz.config_filename = self.config_files_combobox.currentText()
-        self.wiz.log_dir = os.path.normpath(self.log_dir_edit.text())
-        self.wiz.backup_dir = os.path.normpath(self.backup_dir_edit.text())
+        self.wiz.log_dir = normalise_path(self.log_dir_edit.text())
+        self.wiz.backup_dir = normalise_path(self.backup_dir_edit.text())
         self.wiz.backup_interval = self.backup_int_spinbox.value()
         self.wiz.max_backups = self.backup_spinbox.value()
         super().close()
@@ -250,6 +338,7 @@ class RadioButtonGroupDialog(QDialog):
         """
         super().__init__(parent)
 
+        # The dialog's own connections, so they are released with it rather than held by the wizard
         self.connection_manager = ConnectionManager()
 
         self.setWindowTitle("New Radio Button Group")
@@ -281,7 +370,33 @@ class RadioButtonGroupDialog(QDialog):
         """
         The labels of the radio buttons.
         """
-        return self.labelsInput.toPlainText().split("\n")
+        return [line.strip() for line in self.labelsInput.toPlainText().splitlines() if line.strip()]
+
+
+class ImageScanSignals(QObject):
+    """
+    Signals emitted by an ImageScanWorker, as QRunnable cannot emit signals itself.
+    """
+    finished = pyqtSignal(str, bool)
+
+
+class ImageScanWorker(QRunnable):
+    """
+    A QRunnable that checks whether a directory contains any image files away from the GUI thread.
+
+    :param folder_path: The directory to scan.
+    :type folder_path: str
+    """
+    def __init__(self, folder_path: str):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = ImageScanSignals()
+
+    def run(self):
+        """
+        Scans the directory and emits the result.
+        """
+        self.signals.finished.emit(self.folder_path, contains_image_file(self.folder_path))
 
 
 class SelectImagesPage(QWizardPage):
@@ -294,7 +409,7 @@ class SelectImagesPage(QWizardPage):
         """
         super().__init__(parent)
 
-        self.connection_manager = ConnectionManager()
+        self.connection_manager = wiz.connection_manager
 
         self.wiz = wiz
         self.settings = wiz.settings
@@ -308,19 +423,31 @@ class SelectImagesPage(QWizardPage):
         self.folder_button.setFixedSize(25, 25)
         self.folder_label = QLabel()
         self.folder_label.setText(self.settings.value("image_path", ""))
+        # Built the first time a folder without images is chosen
+        self._error_box = None
+        # The folder currently being scanned for images, if any; results for any other folder are stale
+        self._scanning_folder = None
+        # Connections to the running scan worker, released when the scan ends
+        self._scan_connections = ConnectionManager()
 
         # Connect buttons to functions
         self.connection_manager.connect(self.folder_button.clicked, self.select_folder)
 
         expanding_spacer = QSpacerItem(10, 10, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        try:
-            help_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']
-        except KeyError:
-            help_colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryLightColor']
+        help_colour = _theme_colours(self.settings.value('theme', 'dark_blue.xml'))['entry']
+        self.setStyleSheet(f"""
+            QLabel[role="title"] {{
+                font-weight: bold;
+            }}
+            #HelpButton {{
+                color: {help_colour};
+                border: 1px solid {help_colour};
+            }}
+        """)
 
         im_selection_layout = QHBoxLayout()
         im_selection_label = QLabel("Current directory:")
-        im_selection_label.setStyleSheet("font-weight: bold;")
+        im_selection_label.setProperty("role", "title")
         im_selection_layout.addWidget(im_selection_label)
         im_selection_layout.addSpacerItem(expanding_spacer)
         im_selection_layout.addWidget(self.folder_label)
@@ -329,13 +456,12 @@ class SelectImagesPage(QWizardPage):
                                       "This folder should contain the images to be labelled.\n\n"
                                       "N.B. The images can be in subfolders.</p>")
         self.im_folder_explanation_btn = QPushButton('?')
+        self.im_folder_explanation_btn.setObjectName("HelpButton")
         self.im_folder_explanation_btn.setFixedSize(25, 25)
         self.im_folder_explanation_btn.setToolTip(im_folder_explanation_text)
         self.im_folder_explanation_btn.setToolTipDuration(0)
         # self.im_folder_explanation_btn.setDisabled(True)
-        self.connection_manager.connect(self.im_folder_explanation_btn.clicked,
-                                        lambda: self.show_help_box(im_folder_explanation_text))
-        self.im_folder_explanation_btn.setStyleSheet(f"color: {help_colour}; border: 1px solid {help_colour};")
+        self.connection_manager.connect(self.im_folder_explanation_btn.clicked, self._on_help_clicked)
         self.folder_button.setWhatsThis(im_folder_explanation_text)
         im_selection_layout.addWidget(self.im_folder_explanation_btn)
 
@@ -350,8 +476,8 @@ class SelectImagesPage(QWizardPage):
         )
 
     def initializePage(self):
-
-        self.wizard().setButtonLayout([
+        wiz = self.wizard()
+        wiz.setButtonLayout([
             QWizard.WizardButton.CustomButton1,
             QWizard.WizardButton.CustomButton2,
             QWizard.WizardButton.Stretch,
@@ -360,54 +486,83 @@ class SelectImagesPage(QWizardPage):
             QWizard.WizardButton.CancelButton
         ])
 
-        self.wizard().button(QWizard.WizardButton.BackButton).hide()
+        wiz.button(QWizard.WizardButton.BackButton).hide()
 
-        advanced_button = QPushButton("Advanced")
-        self.connection_manager.connect(advanced_button.clicked, self.open_advanced_settings)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton1, advanced_button)
+        wiz.button(QWizard.WizardButton.NextButton).setEnabled(False)
 
-        load_config_button = QPushButton("Load Config.")
-        self.connection_manager.connect(load_config_button.clicked, self.wiz.config_load_dialog)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton2, load_config_button)
+    @pyqtSlot()
+    def select_folder(self):
+        """
+        Open file dialog to select directory. The directory is scanned for images in a background thread.
+        """
+        # Open file dialog to select image folder
+        folder_path = QFileDialog.getExistingDirectory(self, "Select Image Directory", self.folder_label.text())
+
+        # Update label and check for images without blocking the GUI
+        if folder_path and self._scanning_folder is None:
+            self.folder_label.setText(folder_path)
+            # Hold the user on this page, with a busy cursor, until the scan has finished
+            self.wizard().button(QWizard.WizardButton.NextButton).setEnabled(False)
+            self.folder_button.setEnabled(False)
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            self._scanning_folder = folder_path
+            self.scan_worker = ImageScanWorker(folder_path)
+            self._scan_connections.connect(self.scan_worker.signals.finished, self.on_folder_scanned)
+            QThreadPool.globalInstance().start(self.scan_worker)
+
+    def end_scan(self):
+        """
+        Ends the image directory scan, if one is running, restoring the cursor and the folder button. Any result
+        that arrives afterwards is ignored.
+        """
+        if self._scanning_folder is None:
+            return
+        self._scanning_folder = None
+        self._scan_connections.disconnect_all()
+        self.scan_worker = None
+        self.folder_button.setEnabled(True)
+        QApplication.restoreOverrideCursor()
+
+    @pyqtSlot(str, bool)
+    def on_folder_scanned(self, folder_path: str, has_images: bool):
+        """
+        Handles the result of the image directory scan.
 
-        self.wizard().button(QWizard.WizardButton.NextButton).setEnabled(False)
+        :param folder_path: The directory that was scanned.
+        :type folder_path: str
+        :param has_images: Whether the directory contains any image files.
+        :type has_images: bool
+        """
+        if folder_path != self._scanning_folder:
+            # The scan was ended early, e.g. by the wizard closing
+            return
+        self.end_scan()
+        wiz = self.wizard()
+        if not has_images:
+            if self._error_box is None:
+                self._error_box = QMessageBox()
+                self._error_box.setIcon(QMessageBox.Icon.Warning)
+                self._error_box.setWindowTitle("Error")
+                self._error_box.setText("The directory does not appear to contain any image files!")
+                self._error_box.setInformativeText("Please try again.")
+            self._error_box.exec()
+            wiz.button(QWizard.WizardButton.NextButton).setEnabled(False)
+            self.select_folder()
+        else:
+            self.folder_label.setText(folder_path)
+            self.settings.setValue("image_path", folder_path)
+            wiz.button(QWizard.WizardButton.NextButton).setEnabled(True)
 
-    def select_folder(self):
+    @pyqtSlot()
+    def _on_help_clicked(self):
         """
-        Open file dialog to select directory.
-        """
-        image_dir = None
-        while image_dir is None:
-            # Open file dialog to select image folder
-            folder_path = QFileDialog.getExistingDirectory(self, "Select Image Directory", self.folder_label.text())
-
-            # Update label and save file path
-            if folder_path:
-                self.folder_label.setText(folder_path)
-                img_files = find_relative_image_path(folder_path)
-                if len(img_files) == 0:
-                    error_msg_box = QMessageBox()
-                    error_msg_box.setIcon(QMessageBox.Icon.Warning)
-                    error_msg_box.setWindowTitle("Error")
-                    error_msg_box.setText("The directory does not appear to contain any image files!")
-                    error_msg_box.setInformativeText("Please try again.")
-                    error_msg_box.exec()
-                    self.wizard().button(QWizard.WizardButton.NextButton).setEnabled(False)
-                else:
-                    self.folder_label.setText(folder_path)
-                    self.settings.setValue("image_path", folder_path)
-                    image_dir = folder_path
-                    self.wizard().button(QWizard.WizardButton.NextButton).setEnabled(True)
-            else:
-                break
+        Shows the help text of the help button that was clicked, which is also its tooltip.
+        """
+        self.show_help_box(self.sender().toolTip())
 
     def show_help_box(self, message):
         QMessageBox.information(self, "Help", message)
 
-    def open_advanced_settings(self):
-        advanced_settings_dialog = AdvancedSettingsDialog(self)
-        advanced_settings_dialog.exec()
-
 
 class UnifiedCheckboxPage(QWizardPage):
     def __init__(self, wiz, parent=None):
@@ -448,15 +603,33 @@ class UnifiedCheckboxPage(QWizardPage):
         self.cbox_top_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.scrollArea.setWidget(self.cbox_widget)
 
+        # The checkbox rows are only built when the page is first shown (or its data is needed)
+        self._populated = False
+        # The line edit of each row, in order, so the labels can be read back without walking the layouts
+        self._cbox_line_edits = []
+
+    def ensure_populated(self, all_rows: bool = False):
+        """
+        Builds the page's frame if this has not already been done. The checkbox rows are then added a batch at a time
+        from the event loop, so the page is shown without waiting for them.
+
+        :param all_rows: Whether to add any rows that are still waiting straight away, e.g. before reading them back.
+        :type all_rows: bool
+        """
+        if not self._populated:
+            self._populate()
+            self._populated = True
+        if all_rows:
+            self._add_pending_cboxes(None)
+
+    def _populate(self):
+        """
+        Builds the frame containing the tri-state option and a row for each checkbox label.
+        """
         self.cbox_lower_layout = QVBoxLayout()
 
         frame = QFrame()
         frame.setObjectName("CBoxFrame")
-        try:
-            border_color = get_theme(self.settings.value("theme", 'dark_blue.xml'))['secondaryLightColor']
-        except KeyError:
-            border_color = get_theme(self.settings.value("theme", 'dark_blue.xml'))['secondaryColor']
-        frame.setStyleSheet(f"#CBoxPageFrame {{ border: 2px solid {border_color}; border-radius: 5px; }}")
 
         self.add_cbox_button = QPushButton("+")
         self.add_cbox_button.setProperty('class', 'success')
@@ -468,19 +641,55 @@ class UnifiedCheckboxPage(QWizardPage):
         self.cbox_lower_layout.addLayout(row_header_layout)
 
         self.cbox_box_layouts = QVBoxLayout()
-        for cbox in self.cboxes:
-            self.add_cbox(cbox)
+        self._pending_cboxes = list(self.cboxes)
+        QTimer.singleShot(0, self._add_pending_cboxes)
 
         self.cbox_lower_layout.addLayout(self.cbox_box_layouts)
         frame.setLayout(self.cbox_lower_layout)
 
         self.cbox_top_layout.addWidget(frame)
 
-        self.connection_manager.connect(self.add_cbox_button.clicked, lambda: self.add_cbox())
+        self.connection_manager.connect(self.add_cbox_button.clicked, self.add_new_cbox)
+
+    def _add_pending_cboxes(self, batch_size: Optional[int] = 20):
+        """
+        Adds the next batch of checkbox rows from the config, scheduling another batch if any rows remain.
+
+        :param batch_size: The number of rows to add, or None to add all of the remaining rows.
+        :type batch_size: Optional[int]
+        """
+        if not self._pending_cboxes:
+            return
+        if batch_size is None:
+            batch_size = len(self._pending_cboxes)
+        batch, self._pending_cboxes = self._pending_cboxes[:batch_size], self._pending_cboxes[batch_size:]
+
+        # Lay out and repaint the rows once per batch rather than once per row
+        self.setUpdatesEnabled(False)
+        self.cbox_widget.blockSignals(True)
+        try:
+            for cbox in batch:
+                self.add_cbox(cbox)
+        finally:
+            self.cbox_widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+        self.cbox_widget.updateGeometry()
+        if self._pending_cboxes:
+            QTimer.singleShot(0, self._add_pending_cboxes)
+
+    @pyqtSlot()
+    def add_new_cbox(self):
+        """
+        Adds an empty checkbox row below the rows loaded from the config.
+        """
+        self._add_pending_cboxes(None)
+        self.add_cbox()
 
     def initializePage(self):
+        wiz = self.wizard()
+        self.ensure_populated()
 
-        self.wizard().setButtonLayout([
+        wiz.setButtonLayout([
             QWizard.WizardButton.CustomButton1,
             QWizard.WizardButton.CustomButton2,
             QWizard.WizardButton.Stretch,
@@ -489,18 +698,6 @@ class UnifiedCheckboxPage(QWizardPage):
             QWizard.WizardButton.CancelButton
         ])
 
-        advanced_button = QPushButton("Advanced")
-        self.connection_manager.connect(advanced_button.clicked, self.open_advanced_settings)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton1, advanced_button)
-
-        load_config_button = QPushButton("Load Config.")
-        self.connection_manager.connect(load_config_button.clicked, self.wiz.config_load_dialog)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton2, load_config_button)
-
-    def open_advanced_settings(self):
-        advanced_settings_dialog = AdvancedSettingsDialog(self)
-        advanced_settings_dialog.exec()
-
     def add_cbox(self, label_text=""):
         """
         Adds a label to the list of labels.
@@ -510,15 +707,40 @@ class UnifiedCheckboxPage(QWizardPage):
         remove_button.setProperty('class', 'danger')
         # remove_button.setFixedSize(100, 40)
 
-        self.connection_manager.connect(
-            remove_button.clicked, lambda: self.remove_cbox(line_edit, remove_button)
-        )
+        # All of the remove buttons share one slot, which finds its row's line edit through this property
+        remove_button.setProperty('partner', line_edit)
+        self.connection_manager.connect(remove_button.clicked, self._on_remove)
 
         # Create a horizontal layout for the line edit and the remove button
         hbox = QHBoxLayout()
         hbox.addWidget(line_edit)
         hbox.addWidget(remove_button)
         self.cbox_box_layouts.addLayout(hbox)
+        self._cbox_line_edits.append(line_edit)
+
+    def get_cbox_labels(self) -> list:
+        """
+        Returns the non-empty checkbox labels, in the order they are shown.
+
+        :return: The checkbox labels.
+        :rtype: list
+        """
+        labels = []
+        for line_edit in self._cbox_line_edits:
+            text = line_edit.text()
+            if text:
+                labels.append(text)
+        return labels
+
+    @pyqtSlot()
+    def _on_remove(self):
+        """
+        Removes the row of the remove button that was clicked.
+        """
+        button = self.sender()
+        line_edit = button.property('partner')
+        self._cbox_line_edits.remove(line_edit)
+        self.remove_cbox(line_edit, button)
 
     @staticmethod
     def remove_cbox(line_edit, button):
@@ -547,6 +769,9 @@ class UnifiedCheckboxPage(QWizardPage):
 
 
 class ResolveConflictsPage(QWizardPage):
+    # The parts of the annotators' configs that must match for their JSONs to be compared
+    _KEYS_TO_CHECK = ('checkboxes', 'radiobuttons', 'tristate_checkboxes')
+
     def __init__(self, wiz, parent=None):
         """
         Initializes the page.
@@ -603,6 +828,10 @@ class ResolveConflictsPage(QWizardPage):
         self.json2_edit.show()
         self.json2_button.show()
 
+        # The paths and modification times of the last pair of JSONs checked, and whether they were compatible
+        self._last_check = None
+        self._warning_box = None
+
     def browse_json1(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select First JSON File", "", "JSON Files (*.json)")
         if file_path:
@@ -618,49 +847,56 @@ class ResolveConflictsPage(QWizardPage):
     def check_json_compatibility(self):
         def _read_jsons(json_paths):
             json_data = []
-            for i, json_path in enumerate(json_paths):
+            for json_path in json_paths:
                 if json_path:
-                    with open(json_path, "r") as f:
-                        json_data.append(json.load(f))
+                    json_data.append(read_json_cached(json_path))
             return json_data
 
         def _compare_json_config(json_data):
-            config_dicts = []
-            keys_to_check = ['checkboxes', 'radiobuttons', 'tristate_checkboxes']
-            for j in json_data:
-                if 'config' not in j:
-                    return False
-                config_dicts.append({k: j['config'][k] for k in keys_to_check if k in j['config']})
-            if config_dicts:
-                reference = config_dicts[0]
-            for other in config_dicts[1:]:
-                if other != reference:
-                    return False
+            if any('config' not in j for j in json_data):
+                return False
+            if not json_data:
+                return True
+            # Compare each config against the first, stopping at the first key that differs
+            reference = json_data[0]['config']
+            for j in json_data[1:]:
+                config = j['config']
+                for k in self._KEYS_TO_CHECK:
+                    if config.get(k, _MISSING) != reference.get(k, _MISSING):
+                        return False
             return True
 
         def _show_incompatible_json_warning():
-            # Display warning message
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Icon.Critical)
-            msg_box.setText(f"Error!\n\nThe JSONs for the annotators have incompatible configurations.\n\n"
-                            f"Please check that the same checkboxes and radiobuttons were used.")
-            ok_button = msg_box.addButton('Ok', QMessageBox.ButtonRole.AcceptRole)
-            msg_box.exec()
-
+            # Display warning message, building the box the first time it is needed
+            if self._warning_box is None:
+                self._warning_box = QMessageBox(self)
+                self._warning_box.setIcon(QMessageBox.Icon.Critical)
+                self._warning_box.setText(f"Error!\n\nThe JSONs for the annotators have incompatible configurations.\n\n"
+                                          f"Please check that the same checkboxes and radiobuttons were used.")
+                self._warning_box.addButton('Ok', QMessageBox.ButtonRole.AcceptRole)
+            self._warning_box.exec()
+
+        wiz = self.wizard()
         if self.json1_edit and self.json2_edit:
-            jsons = _read_jsons([self.json1_edit.text(), self.json2_edit.text()])
-            compatible = _compare_json_config(jsons)
+            json_paths = [self.json1_edit.text(), self.json2_edit.text()]
+            check_key = tuple((path, file_signature(path) if path else None) for path in json_paths)
+            if self._last_check is not None and self._last_check[0] == check_key:
+                compatible = self._last_check[1]
+            else:
+                compatible = _compare_json_config(_read_jsons(json_paths))
+                self._last_check = (check_key, compatible)
             if compatible:
-                self.wizard().button(QWizard.WizardButton.FinishButton).setEnabled(True)
+                wiz.button(QWizard.WizardButton.FinishButton).setEnabled(True)
             else:
-                self.wizard().button(QWizard.WizardButton.FinishButton).setEnabled(False)
+                wiz.button(QWizard.WizardButton.FinishButton).setEnabled(False)
                 _show_incompatible_json_warning()
         else:
-            self.wizard().button(QWizard.WizardButton.FinishButton).setEnabled(False)
+            wiz.button(QWizard.WizardButton.FinishButton).setEnabled(False)
 
 
     def initializePage(self):
-        self.wizard().setButtonLayout([
+        wiz = self.wizard()
+        wiz.setButtonLayout([
             QWizard.WizardButton.CustomButton1,
             QWizard.WizardButton.CustomButton2,
             QWizard.WizardButton.Stretch,
@@ -670,19 +906,7 @@ class ResolveConflictsPage(QWizardPage):
             QWizard.WizardButton.CancelButton
         ])
 
-        self.wizard().button(QWizard.WizardButton.NextButton).hide()
-
-        advanced_button = QPushButton("Advanced")
-        self.connection_manager.connect(advanced_button.clicked, self.open_advanced_settings)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton1, advanced_button)
-
-        load_config_button = QPushButton("Load Config.")
-        self.connection_manager.connect(load_config_button.clicked, self.wiz.config_load_dialog)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton2, load_config_button)
-
-    def open_advanced_settings(self):
-        advanced_settings_dialog = AdvancedSettingsDialog(self)
-        advanced_settings_dialog.exec()
+        wiz.button(QWizard.WizardButton.NextButton).hide()
 
     def get_json_file_paths(self, conflict_res):
         """
@@ -708,7 +932,10 @@ class UnifiedRadiobuttonPage(QWizardPage):
         self.connection_manager = wiz.connection_manager
 
         self.wiz = wiz
-        self.radiobuttons = []
+        # Each group's title and labels, keyed by its group box; dicts keep insertion order, so the saved order is
+        # preserved
+        self._group_titles = {}
+        self._group_labels = {}
         self.settings = wiz.settings
 
         self.setTitle(f"Radiobuttons")
@@ -742,11 +969,26 @@ class UnifiedRadiobuttonPage(QWizardPage):
         self.scrollLayout.addLayout(self.rbox_layout)
         self.scrollLayout.addStretch()
 
-        self.connection_manager.connect(self.add_rbox_button.clicked, lambda: self.add_group())
+        self.connection_manager.connect(self.add_rbox_button.clicked, self.add_group)
+
+        # Groups loaded from the config are only built when the page is first shown (or its data is needed)
+        self._populated = False
+        self._pending_group_data = []
+
+    def ensure_populated(self):
+        """
+        Builds the radio button groups loaded from the config if this has not already been done.
+        """
+        if not self._populated:
+            self._populated = True
+            pending_group_data, self._pending_group_data = self._pending_group_data, []
+            self.load_group_data(pending_group_data)
 
     def initializePage(self):
+        wiz = self.wizard()
+        self.ensure_populated()
 
-        self.wizard().setButtonLayout([
+        wiz.setButtonLayout([
             QWizard.WizardButton.CustomButton1,
             QWizard.WizardButton.CustomButton2,
             QWizard.WizardButton.Stretch,
@@ -757,65 +999,18 @@ class UnifiedRadiobuttonPage(QWizardPage):
         ])
 
         # self.wizard().button(QWizard.WizardButton.BackButton).hide()
-        self.wizard().button(QWizard.WizardButton.NextButton).hide()
-
-        advanced_button = QPushButton("Advanced")
-        self.connection_manager.connect(advanced_button.clicked, self.open_advanced_settings)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton1, advanced_button)
-
-        load_config_button = QPushButton("Load Config.")
-        self.connection_manager.connect(load_config_button.clicked, self.wiz.config_load_dialog)
-        self.wizard().setButton(QWizard.WizardButton.CustomButton2, load_config_button)
-
-    def open_advanced_settings(self):
-        advanced_settings_dialog = AdvancedSettingsDialog(self)
-        advanced_settings_dialog.exec()
+        wiz.button(QWizard.WizardButton.NextButton).hide()
 
+    @pyqtSlot()
     def add_group(self):
         """
         Adds a radio button group to the page.
         """
         dialog = RadioButtonGroupDialog()
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            group = QGroupBox()
-            group.setStyleSheet("QGroupBox { margin-top: 0px; padding: 10px; }")
-            group_layout = QVBoxLayout()
-            grid_layout = QGridLayout()
-
-            remove_button = QPushButton("-")
-            remove_button.setProperty('class', 'danger')
-
-            title_layout = QHBoxLayout()
-            title_label = QLabel(dialog.title)
-            title_layout.addWidget(title_label)
-            title_layout.addStretch()
-            title_layout.addWidget(remove_button)
-            title_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-            title_label.setStyleSheet("font-weight: bold; text-transform: uppercase;")
-            group_layout.addLayout(title_layout)
-
-            max_label_length = max([len(str(label)) for label in dialog.labels])
-            num_columns = ceil(10 / max_label_length)  # Adjust the number of columns based on the label length
-
-            for i, text in enumerate(dialog.labels):
-                radio_button = QRadioButton(str(text))
-                radio_button.setEnabled(False)
-                row = i // num_columns
-                col = i % num_columns
-                grid_layout.addWidget(radio_button, row, col)
-
-            group_layout.addLayout(grid_layout)
-            group.setLayout(group_layout)
-            self.rbox_layout.addWidget(group)
-
-            # Add the group to the radio_groups list
-            self.radiobuttons.append({
-                'group': group,
-                'title': dialog.title,
-                'labels': dialog.labels
-            })
-
-            self.connection_manager.connect(remove_button.clicked, lambda: self.remove_group(group))
+        accepted = dialog.exec() == QDialog.DialogCode.Accepted
+        dialog.connection_manager.disconnect_all()
+        if accepted:
+            self.add_group_without_dialog(dialog.title, dialog.labels)
 
     def add_group_without_dialog(self, title, labels):
         """
@@ -826,8 +1021,67 @@ class UnifiedRadiobuttonPage(QWizardPage):
         :param labels: The labels of the radio buttons.
         :type labels: list
         """
+        label_strs, num_columns = self._group_shape(labels)
+        group, remove_button = self._build_group_widget(title, label_strs, num_columns)
+        self._register_group(group, remove_button, title, labels)
+
+    def _register_group(self, group, remove_button, title, labels):
+        """
+        Adds a built group to the page and records its title and labels.
+
+        :param group: The group box.
+        :type group: QGroupBox
+        :param remove_button: The group's remove button.
+        :type remove_button: QPushButton
+        :param title: The title of the group.
+        :type title: str
+        :param labels: The labels of the radio buttons.
+        :type labels: list
+        """
+        self.rbox_layout.addWidget(group)
+
+        # Record the group's title and labels
+        self._group_titles[group] = title
+        self._group_labels[group] = labels
+
+        # All of the remove buttons share one slot, which finds its group through this property
+        remove_button.setProperty('groupRef', group)
+        self.connection_manager.connect(remove_button.clicked, self._on_remove_group)
+
+    @staticmethod
+    def _group_shape(labels) -> Tuple[list, int]:
+        """
+        Works out the text of a group's radio buttons and how many columns to lay them out in.
+
+        :param labels: The labels of the radio buttons.
+        :type labels: list
+        :return: The labels as strings and the number of columns.
+        :rtype: Tuple[list, int]
+        """
+        # Convert the labels to strings once, for both measuring and the buttons' text
+        label_strs = [str(label) for label in labels]
+
+        # Adjust the number of columns based on the label length (ceil(10 / max_label_length) in integer math)
+        max_label_length = max(map(len, label_strs), default=1) or 1
+        num_columns = max(1, (10 + max_label_length - 1) // max_label_length)
+        return label_strs, num_columns
+
+    def _build_group_widget(self, title, label_strs, num_columns):
+        """
+        Builds the widget for a radio button group, showing its title, a remove button and the (disabled) radio
+        buttons. The widgets are styled by object name through the wizard's stylesheet.
+
+        :param title: The title of the group.
+        :type title: str
+        :param label_strs: The text of the radio buttons.
+        :type label_strs: list
+        :param num_columns: The number of columns to lay the radio buttons out in.
+        :type num_columns: int
+        :return: The group box and its remove button.
+        :rtype: Tuple[QGroupBox, QPushButton]
+        """
         group = QGroupBox()
-        group.setStyleSheet("QGroupBox { margin-top: 0px; padding: 10px; }")
+        group.setObjectName("rbGroup")
         group_layout = QVBoxLayout()
         grid_layout = QGridLayout()
 
@@ -840,14 +1094,13 @@ class UnifiedRadiobuttonPage(QWizardPage):
         title_layout.addStretch()
         title_layout.addWidget(remove_button)
         title_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        title_label.setStyleSheet("font-weight: bold; text-transform: uppercase;")
+        title_label.setObjectName("rbTitle")
         group_layout.addLayout(title_layout)
 
-        max_label_length = max(len(str(label)) for label in labels)
-        num_columns = ceil(10 / max_label_length)
-
-        for i, text in enumerate(labels):
-            radio_button = QRadioButton(str(text))
+        grid_layout.setContentsMargins(0, 0, 0, 0)
+        grid_layout.setSpacing(2)
+        for i, text in enumerate(label_strs):
+            radio_button = QRadioButton(text, group)
             radio_button.setEnabled(False)
             row = i // num_columns
             col = i % num_columns
@@ -855,28 +1108,30 @@ class UnifiedRadiobuttonPage(QWizardPage):
 
         group_layout.addLayout(grid_layout)
         group.setLayout(group_layout)
-        self.rbox_layout.addWidget(group)
 
-        self.radiobuttons.append({
-            'group': group,
-            'title': title,
-            'labels': labels
-        })
+        return group, remove_button
 
-        self.connection_manager.connect(remove_button.clicked, lambda: self.remove_group(group))
+    @pyqtSlot()
+    def _on_remove_group(self):
+        """
+        Removes the group of the remove button that was clicked.
+        """
+        self.remove_group(self.sender().property('groupRef'))
 
     def remove_group(self, group):
         """
         Removes a radio button group from the page.
+
+        :param group: The group box to remove.
+        :type group: QGroupBox
         """
-        # Find the group entry in radio_groups and remove it
-        for radio_group in self.radiobuttons:
-            if radio_group['group'] is group:
-                self.scrollLayout.removeWidget(group)
-                group.setParent(None)
-                group.deleteLater()
-                self.radiobuttons.remove(radio_group)
-                break
+        if group not in self._group_titles:
+            return
+        del self._group_titles[group]
+        del self._group_labels[group]
+        self.scrollLayout.removeWidget(group)
+        group.setParent(None)
+        group.deleteLater()
 
     def get_group_data(self) -> list:
         """
@@ -885,13 +1140,8 @@ class UnifiedRadiobuttonPage(QWizardPage):
         :return: The data for the radio button groups.
         :rtype: list
         """
-        group_data = []
-        for radio_group in self.radiobuttons:
-            group_data.append({
-                'title': radio_group['title'],
-                'labels': radio_group['labels']
-            })
-        return group_data
+        return [{'title': title, 'labels': labels}
+                for title, labels in zip(self._group_titles.values(), self._group_labels.values())]
 
     def load_group_data(self, group_data):
         """
@@ -900,8 +1150,25 @@ class UnifiedRadiobuttonPage(QWizardPage):
         :param group_data: The radio button group data.
         :type group_data: list
         """
-        for group in group_data:
-            self.add_group_without_dialog(group['title'], group['labels'])
+        if not self._populated:
+            self._pending_group_data.extend(group_data)
+            return
+
+        # Disable updates so the groups are laid out and repainted once rather than once per group
+        container = self.rbox_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        container.blockSignals(True)
+        try:
+            # Work out every group's shape, build all of the widgets, then add them to the page in one pass
+            shapes = [(group['title'], group['labels'], self._group_shape(group['labels'])) for group in group_data]
+            built = [(title, labels, self._build_group_widget(title, label_strs, num_columns))
+                     for title, labels, (label_strs, num_columns) in shapes]
+            for title, labels, (group, remove_button) in built:
+                self._register_group(group, remove_button, title, labels)
+        finally:
+            container.blockSignals(False)
+            container.setUpdatesEnabled(True)
+            container.updateGeometry()
 
 
 class ConfigurationWizard(QWizard):
@@ -920,8 +1187,6 @@ class ConfigurationWizard(QWizard):
         - add_label: Adds a new label to the label page for a new checkbox/finding.
         - create_save_page: Creates the third page of the wizard, allowing users to save the
                                 configuration to a .yml file.
-        - update_combobox_stylesheet: Updates the stylesheet of the QComboBoxes in the label page
-                                        to make the options more visible.
         - update_combobox_state: Updates the QComboBox on the save page with the list of existing .yml files.
         - accept: Saves the configuration to a .yml file and closes the wizard.
     """
@@ -938,17 +1203,23 @@ class ConfigurationWizard(QWizard):
         self.connection_manager = ConnectionManager()
         self.skip = False
         self.pages = []
+        # The id each page was given when it was added, so pages can be removed without searching for them
+        self._page_ids = {}
+        self._advanced_dialog = None
 
+        colour = get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']
         self.setStyleSheet(f"""
             QLineEdit {{
-                color: {get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']};
+                color: {colour};
             }}
             QSpinBox {{
-                color: {get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']};
+                color: {colour};
             }}
             QComboBox {{
-                color: {get_theme(self.settings.value('theme', 'dark_blue.xml'))['secondaryTextColor']};
+                color: {colour};
             }}
+            {_GROUPBOX_QSS}
+            {_TITLE_QSS}
         """)
 
         # Set the wizard style to have the title and icon at the top
@@ -961,13 +1232,22 @@ class ConfigurationWizard(QWizard):
         # Enable IndependentPages option
         self.setOption(QWizard.WizardOption.IndependentPages, True)
 
-        # Set the logo pixmap
-        icon_path = os.path.normpath(os.path.join(resource_dir, 'assets/3x/white_panel@3x.png'))
-        pixmap = QPixmap(icon_path)
-        self.setPixmap(QWizard.WizardPixmap.LogoPixmap, pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio))
+        # The custom buttons are shared by every page, so they are created and connected only once
+        self.advanced_button = QPushButton("Advanced")
+        self.connection_manager.connect(self.advanced_button.clicked, self.on_advanced_clicked)
+        self.setButton(QWizard.WizardButton.CustomButton1, self.advanced_button)
+
+        self.load_config_button = QPushButton("Load Config.")
+        self.connection_manager.connect(self.load_config_button.clicked, self.config_load_dialog)
+        self.setButton(QWizard.WizardButton.CustomButton2, self.load_config_button)
+
+        # Set the logo pixmap once the window has been shown, so decoding it does not hold up the first paint
+        QTimer.singleShot(0, self._install_logo)
 
         # Load the config file
-        self.config_data = open_yml_file(os.path.normpath(os.path.join(resource_dir, self.config_filename)))
+        self.saved_config_path = os.path.normpath(os.path.join(resource_dir, self.config_filename))
+        self.config_data = open_yml_file(self.saved_config_path)
+        self.saved_config_digest = _config_digest(self.config_data)
 
         self.max_backups = self.config_data.get('max_backups', 10)
         self.backup_interval = self.config_data.get('backup_interval', 5)
@@ -984,15 +1264,16 @@ class ConfigurationWizard(QWizard):
 
         self.tristate_checkboxes = bool(self.config_data.get('tristate_checkboxes', False))
         self.cboxes = self.config_data.get('checkboxes', [])
-        self.cbox_page = UnifiedCheckboxPage(self)
-
         self.conflict_resolution_json_files = self.config_data.get('conflict_resolution_json_files', {})
-        self.conflict_resolution_page = ResolveConflictsPage(self)
-
         self.radiobuttons = self.config_data.get('radiobuttons', [])
-        self.radio_page = UnifiedRadiobuttonPage(self)
-        self.radio_page.load_group_data(self.radiobuttons)
 
+        # The remaining pages are only built once they are needed, see the properties below
+        self._cbox_page = None
+        self._conflict_resolution_page = None
+        self._radio_page = None
+
+        # The conflict resolution mode the pages were last set up for
+        self._last_cr_state = None
         self.setup_pages()
 
         # Set the window title and modality
@@ -1007,43 +1288,132 @@ class ConfigurationWizard(QWizard):
 
         self.connection_manager.connect(self.currentIdChanged, self.on_current_id_changed)
 
+    def addPage(self, page: QWizardPage) -> int:
+        """
+        Adds a page to the wizard, recording the id it is given.
+
+        :param page: The page to add.
+        :type page: QWizardPage
+        :return: The page's id.
+        :rtype: int
+        """
+        page_id = super().addPage(page)
+        self._page_ids[page] = page_id
+        return page_id
+
+    def _install_logo(self):
+        """
+        Sets the wizard's logo pixmap.
+        """
+        icon_path = os.path.normpath(os.path.join(resource_dir, 'assets/3x/white_panel@3x.png'))
+        self.setPixmap(QWizard.WizardPixmap.LogoPixmap, _scaled_pixmap(icon_path, 250, 250))
+
+    @property
+    def cbox_page(self) -> 'UnifiedCheckboxPage':
+        """
+        The checkbox page, built the first time it is accessed.
+        """
+        if self._cbox_page is None:
+            self._cbox_page = UnifiedCheckboxPage(self)
+        return self._cbox_page
+
+    @property
+    def conflict_resolution_page(self) -> 'ResolveConflictsPage':
+        """
+        The conflict resolution page, built the first time it is accessed.
+        """
+        if self._conflict_resolution_page is None:
+            self._conflict_resolution_page = ResolveConflictsPage(self)
+        return self._conflict_resolution_page
+
+    @property
+    def radio_page(self) -> 'UnifiedRadiobuttonPage':
+        """
+        The radio button page, built the first time it is accessed.
+        """
+        if self._radio_page is None:
+            self._radio_page = UnifiedRadiobuttonPage(self)
+            self._radio_page.load_group_data(self.radiobuttons)
+        return self._radio_page
+
     def setup_pages(self):
-        # Clear all dynamic pages
-        current_page_ids = self.pageIds()
-        dynamic_pages = [self.cbox_page, self.radio_page, self.conflict_resolution_page]
-
-        # Remove pages by checking their references
-        for page in dynamic_pages:
-            # Obtain the page ID by checking if it's in the wizard's current page list
-            page.setCommitPage(False)
-            for page_id in current_page_ids:
-                if self.page(page_id) is page:
+        # Nothing to do if the pages are already set up for this mode
+        if self._last_cr_state == self.conflict_resolution:
+            return
+
+        # Swap the pages with the wizard's signals blocked, then report the resulting page once
+        with QSignalBlocker(self):
+            # Clear all dynamic pages that have been built so far
+            dynamic_pages = [page for page in (self._cbox_page, self._radio_page, self._conflict_resolution_page)
+                             if page is not None]
+
+            # Remove the pages that are currently added, using the ids recorded when they were added
+            for page in dynamic_pages:
+                page.setCommitPage(False)
+                page_id = self._page_ids.pop(page, None)
+                if page_id is not None:
                     self.removePage(page_id)
 
-        # Manually manage pages list to ensure accuracy
-        self.pages.clear()
-
-        # Always add the image selection page since it's a static first page
-        if self.image_dir_selection_page not in self.pages:
-            self.pages.append(self.image_dir_selection_page)
-
-        # Based on the conflict resolution, conditionally add other pages
-        if not self.conflict_resolution:
-            self.addPage(self.cbox_page)
-            self.pages.append(self.cbox_page)
-            self.addPage(self.radio_page)
-            self.pages.append(self.radio_page)
-            self.image_dir_selection_page.setCommitPage(False)
-            self.radio_page.setCommitPage(True)
-        else:
-            self.addPage(self.conflict_resolution_page)
-            self.pages.append(self.conflict_resolution_page)
-            self.image_dir_selection_page.setCommitPage(False)
-            self.conflict_resolution_page.setCommitPage(True)
+            # Manually manage pages list to ensure accuracy
+            self.pages.clear()
+
+            # Always add the image selection page since it's a static first page
+            if self.image_dir_selection_page not in self.pages:
+                self.pages.append(self.image_dir_selection_page)
+
+            # Based on the conflict resolution, conditionally add other pages
+            if not self.conflict_resolution:
+                self.addPage(self.cbox_page)
+                self.pages.append(self.cbox_page)
+                self.addPage(self.radio_page)
+                self.pages.append(self.radio_page)
+                self.image_dir_selection_page.setCommitPage(False)
+                self.radio_page.setCommitPage(True)
+            else:
+                self.addPage(self.conflict_resolution_page)
+                self.pages.append(self.conflict_resolution_page)
+                self.image_dir_selection_page.setCommitPage(False)
+                self.conflict_resolution_page.setCommitPage(True)
+
+        self._last_cr_state = self.conflict_resolution
+        self.currentIdChanged.emit(self.currentId())
+
+    def done(self, result: int):
+        """
+        Closes the wizard, first ending any image scan still running so its busy cursor is not left behind. Once
+        finished has been emitted (and the config saved), the wizard's connections are released.
+
+        :param result: The dialog result code.
+        :type result: int
+        """
+        self.image_dir_selection_page.end_scan()
+        super().done(result)
+        self.connection_manager.disconnect_all()
 
     def on_current_id_changed(self, id: int):
-        if self.page(id) is self.conflict_resolution_page:
-            self.conflict_resolution_page.check_json_compatibility()
+        if self._conflict_resolution_page is not None and self.page(id) is self._conflict_resolution_page:
+            # Let the page paint before the JSONs are read
+            QTimer.singleShot(0, self._conflict_resolution_page.check_json_compatibility)
+
+    def open_advanced_settings(self, page: QWizardPage):
+        """
+        Shows the advanced settings dialog, which is built on first use and then shared by all of the pages.
+
+        :param page: The page the dialog was opened from.
+        :type page: QWizardPage
+        """
+        if self._advanced_dialog is None:
+            self._advanced_dialog = AdvancedSettingsDialog(page)
+        else:
+            self._advanced_dialog.refresh()
+        self._advanced_dialog.exec()
+
+    @pyqtSlot()
+    def on_advanced_clicked(self):
+        """
+        Shows the advanced settings dialog for the current page.
+        """
+        self.open_advanced_settings(self.currentPage())
 
     def update_conflict_resolution(self, state: int):
         self.conflict_resolution = bool(state)
@@ -1051,11 +1421,13 @@ class ConfigurationWizard(QWizard):
 
     def get_annotator_config(self, logger):
         fpath = self.config_data["conflict_resolution_json_files"]['1']
-        with open(fpath, 'r') as f:
-            data = json.load(f)
+        # Usually already parsed by the compatibility check
+        data = read_json_cached(fpath)
         try:
             config = data['config']
-            return config['tristate_checkboxes'], config['checkboxes'], config['radiobuttons']
+            # Copied so the config data being saved does not share lists with the cached JSON
+            return (config['tristate_checkboxes'], copy.deepcopy(config['checkboxes']),
+                    copy.deepcopy(config['radiobuttons']))
         except KeyError as e:
             logger.error("Couldn't find checkbox and radiobutton config in json for annotator 1.")
             raise e
@@ -1069,25 +1441,27 @@ class ConfigurationWizard(QWizard):
         logger, console_msg = setup_logging(os.path.normpath(self.config_data['log_dir']))
 
         if not self.skip:
+            log_dir = os.path.normpath(os.path.abspath(self.log_dir))
+            backup_dir = os.path.normpath(os.path.abspath(self.backup_dir))
 
-            self.config_data['log_dir'] = os.path.normpath(os.path.abspath(self.log_dir))
-            self.config_data['backup_dir'] = os.path.normpath(os.path.abspath(self.backup_dir))
+            self.config_data['log_dir'] = log_dir
+            self.config_data['backup_dir'] = backup_dir
             self.config_data['max_backups'] = self.max_backups
             self.config_data['backup_interval'] = self.backup_interval
             self.config_data['conflict_resolution'] = self.conflict_resolution
-            self.config_data["conflict_resolution_json_files"] = self.conflict_resolution_page.get_json_file_paths(self.conflict_resolution)
+            if self._conflict_resolution_page is not None:
+                json_file_paths = self._conflict_resolution_page.get_json_file_paths(self.conflict_resolution)
+            else:
+                # The page is always built while conflict resolution is on, so it must be off
+                json_file_paths = {"1": "", "2": ""}
+            self.config_data["conflict_resolution_json_files"] = json_file_paths
 
             if not self.conflict_resolution:
+                # Pages that were never shown still need their widgets to read the data back
+                self.cbox_page.ensure_populated(all_rows=True)
+                self.radio_page.ensure_populated()
                 self.config_data['tristate_checkboxes'] = self.cbox_page.tristate_checkboxes
-                cboxes = []
-                for i in range(self.cbox_page.cbox_box_layouts.count()):
-                    hbox = self.cbox_page.cbox_box_layouts.itemAt(i).layout()  # Get the QHBoxLayout
-                    if hbox is not None:
-                        if hbox.count() > 0:
-                            line_edit = hbox.itemAt(0).widget()  # Get the QLineEdit from the QHBoxLayout
-                            if line_edit.text():
-                                cboxes.append(line_edit.text())
-                self.config_data['checkboxes'] = cboxes
+                self.config_data['checkboxes'] = self.cbox_page.get_cbox_labels()
                 self.config_data['radiobuttons'] = self.radio_page.get_group_data()
             else:
                 tristate_checkboxes, checkboxes, radiobuttons = self.get_annotator_config(logger)
@@ -1097,44 +1471,57 @@ class ConfigurationWizard(QWizard):
 
             if not self.config_filename.endswith('.yml'):
                 self.config_filename += '.yml'
-
-            self.settings.setValue("last_config_file", os.path.normpath(
-                os.path.join(os.path.normpath(os.path.abspath(resource_dir)), self.config_filename))
-                                   )
-            self.settings.setValue("log_dir", os.path.normpath(os.path.abspath(self.log_dir)))
-            self.settings.setValue("backup_dir", os.path.normpath(os.path.abspath(self.backup_dir)))
-            self.settings.setValue("max_backups", self.max_backups)
-            self.settings.setValue("backup_interval", self.backup_interval)
-            self.settings.setValue('tristate_checkboxes', self.tristate_checkboxes)
-            self.settings.setValue('conflict_resolution', self.conflict_resolution)
-            self.settings.setValue('conflict_resolution_json_files', self.conflict_resolution_page.get_json_file_paths(self.conflict_resolution))
-
-            # Save the config file
-            with open(os.path.normpath(os.path.join(os.path.abspath(resource_dir), self.config_filename)), 'w') as f:
-                yaml.dump(self.config_data, f)
-
-            # Makes a log of the new configuration
-            logger.info(f"Configuration saved to {os.path.normpath(os.path.join(resource_dir, self.config_filename))}")
+            # resource_dir is already absolute and normalised
+            save_path = os.path.normpath(os.path.join(resource_dir, self.config_filename))
+
+            settings_values = {
+                "last_config_file": save_path,
+                "log_dir": log_dir,
+                "backup_dir": backup_dir,
+                "max_backups": self.max_backups,
+                "backup_interval": self.backup_interval,
+                "tristate_checkboxes": self.tristate_checkboxes,
+                "conflict_resolution": self.conflict_resolution,
+                "conflict_resolution_json_files": json_file_paths,
+            }
+            settings = self.settings
+            for key, value in settings_values.items():
+                settings.setValue(key, value)
+            # Flush all of the values to the backing store in one go
+            settings.sync()
+
+            # Save the config file, skipping the write if it would not change the file on disk
+            config_digest = _config_digest(self.config_data)
+            if (config_digest != self.saved_config_digest or save_path != self.saved_config_path
+                    or not os.path.isfile(save_path)):
+                # A large buffer lets the dumper's many small writes reach the disk in one go
+                with open(save_path, 'w', buffering=1 << 20) as f:
+                    yaml.dump(self.config_data, f, Dumper=SafeDumper)
+                self.saved_config_path = save_path
+                self.saved_config_digest = config_digest
+
+                # Makes a log of the new configuration
+                logger.info(f"Configuration saved to {save_path}")
+            else:
+                logger.info(f"Configuration unchanged in {save_path}")
             # super().close()
 
         else:
 
             logger.info(f"Configuration loaded from {self.config_filepath}.")
 
+    @pyqtSlot()
     def config_load_dialog(self):
-        load_config_dialog = QFileDialog(self)
-        load_config_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-        load_config_dialog.setNameFilter("YAML files (*.yml)")
-        load_config_dialog.setWindowTitle("Load Configuration File")
-        load_config_dialog.setDirectory(resource_dir)
-        load_config_dialog.exec()
-        if load_config_dialog.result() == QDialog.DialogCode.Accepted:
-            self.config_filepath = os.path.normpath(os.path.abspath(load_config_dialog.selectedFiles()[0]))
-            self.settings.setValue("last_config_file", self.config_filepath)
-            self.skip = True
-            super().accept()
-        else:
+        # The static helper uses the native file dialog where the platform has one
+        config_path, _ = QFileDialog.getOpenFileName(
+            self, "Load Configuration File", resource_dir, "YAML files (*.yml)"
+        )
+        if not config_path:
             return
+        self.config_filepath = os.path.normpath(os.path.abspath(config_path))
+        self.settings.setValue("last_config_file", self.config_filepath)
+        self.skip = True
+        super().accept()
 
 
 if __name__ == '__main__':
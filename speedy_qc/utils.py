@@ -15,41 +15,69 @@ Classes:
     ConnectionManager
 
 Functions:
+    normalise_path(path: str) -> str
     create_default_config() -> dict
     open_yml_file(config_path: str) -> dict
+    read_json_cached(json_path: str) -> dict
+    file_signature(path: str) -> Tuple[int, int]
     setup_logging(log_out_path: str) -> Tuple[logging.Logger, logging.Logger]
     bytescale(data: np.ndarray, cmin: int = None, cmax: int = None, high: int = 255, low: int = 0) -> np.ndarray
     convert_to_checkstate(value: Any) -> Qt.CheckState
+    find_relative_image_path(base_path: str, extensions: Collection[str]) -> List[str]
+    contains_image_file(base_path: str) -> bool
+    is_image_filename(name: str) -> bool
 """
 
 import logging.config
 import yaml
 import os
-from typing import Dict, Union, Any, Optional, Tuple, List, Collection
+import copy
+import json
+import re
+from functools import lru_cache
+from collections import OrderedDict
+from typing import Dict, Union, Any, Optional, Tuple, List, Collection, Iterator, Callable
 from PyQt6.QtCore import *
 import numpy as np
 from PIL import Image
-import glob
 import pandas as pd
 import logging
 from logging import FileHandler, StreamHandler
 import sys
 
+try:
+    # Use the LibYAML bindings where PyYAML was built with them
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-else:
-    raise(FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
+# Buffer size for YAML file I/O, so a config is read or written in a single system call
+_YAML_BUFFER_SIZE = 128 * 1024
 
-resource_dir = os.path.normpath(os.path.abspath(resource_dir))
+
+def _find_resource_dir() -> str:
+    """
+    Locates the directory holding main.py and the bundled resources, checking the py2app bundle, this package's
+    directory and the launch directory in turn.
+
+    :return: str, the absolute path to the resource directory.
+    """
+    main_dir = os.path.dirname(os.path.abspath("__main__"))
+    candidates = (
+        getattr(sys, '_MEIPASS', None),  # py2app executable
+        os.path.dirname(os.path.realpath(__file__)),
+        main_dir,  # regular Python script
+        os.path.join(main_dir, 'speedy_qc'),
+        os.path.join(main_dir, 'speedy_qc', 'speedy_qc'),
+    )
+    for candidate in candidates:
+        # A single stat per candidate rather than listing the whole directory
+        if candidate and os.path.isfile(os.path.join(candidate, 'main.py')):
+            return os.path.normpath(os.path.abspath(candidate))
+    raise FileNotFoundError(f"Resource directory not found from {main_dir}")
+
+
+resource_dir = _find_resource_dir()
 
 
 class Connection:
@@ -73,26 +101,48 @@ class ConnectionManager:
     A class to manage multiple connections between signals and slots in a Qt application.
     """
     def __init__(self):
-        self.connections = {}
+        self.connections: List[Connection] = []
 
     def connect(self, signal: Any, slot: callable):
         """
-        Connects a signal to a slot and stores the connection in a dictionary.
+        Connects a signal to a slot and stores the connection in a list.
 
         :param signal: QtCore.pyqtSignal, the signal to connect.
         :param slot: callable, the slot (function or method) to connect to the signal.
         """
-        connection = Connection(signal, slot)
-        self.connections[id(connection)] = connection
+        self.connections.append(Connection(signal, slot))
 
     def disconnect_all(self):
         """
-        Disconnects all connections and clears the dictionary.
+        Disconnects all connections and clears the list.
         """
-        for connection in self.connections.values():
-            if isinstance(connection, Connection):
-                connection.disconnect()
-        self.connections = {}
+        for connection in self.connections:
+            connection.disconnect()
+        self.connections.clear()
+
+
+@lru_cache(maxsize=256)
+def _normalise_absolute_path(path: str) -> str:
+    """
+    Normalises an absolute path, caching the result. Only absolute paths are cached, as the result for a relative
+    or ~ path depends on the working directory and $HOME at the time of the call.
+
+    :param path: str, the absolute path.
+    :return: str, the normalised path.
+    """
+    return os.path.normpath(path)
+
+
+def normalise_path(path: str) -> str:
+    """
+    Expands the user directory in a path and makes it absolute and normalised.
+
+    :param path: str, the path.
+    :return: str, the expanded, absolute, normalised path.
+    """
+    if os.path.isabs(path):
+        return _normalise_absolute_path(path)
+    return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
 
 
 def create_default_config() -> Dict:
@@ -108,21 +158,109 @@ def create_default_config() -> Dict:
         ],
         'radiobuttons': [{'title': "Radiobuttons", 'labels': [1, 2, 3, 4]}, ],
         'max_backups': 10,
-        'backup_dir': os.path.normpath(os.path.abspath(os.path.expanduser('~/speedy_qc/backups'))),
-        'log_dir': os.path.normpath(os.path.abspath(os.path.expanduser('~/speedy_qc/logs'))),
+        'backup_dir': normalise_path('~/speedy_qc/backups'),
+        'log_dir': normalise_path('~/speedy_qc/logs'),
         'tristate_checkboxes': True,
         'backup_interval': 5,
     }
 
-    save_path = os.path.normpath(os.path.join(resource_dir, 'config.yml'))
+    save_path = normalise_path(os.path.join(resource_dir, 'config.yml'))
 
     # Save the default config to the speedy_qc directory
-    with open(save_path, 'w') as f:
-        yaml.dump(default_config, f)
+    with open(save_path, 'wb', buffering=_YAML_BUFFER_SIZE) as f:
+        yaml.dump(default_config, f, Dumper=SafeDumper, encoding='utf-8')
 
     return default_config
 
 
+def file_signature(path: str) -> Tuple[int, int]:
+    """
+    Returns a file's modification time in nanoseconds and its size, which together tell whether it has changed.
+
+    :param path: str, the path to the file.
+    :return: tuple, the (st_mtime_ns, st_size) of the file.
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _load_cached(cache: OrderedDict, max_size: int, path: str, parse: Callable[[str], Any]) -> Any:
+    """
+    Loads a file through an LRU cache keyed by real path, reusing the previously parsed data if the file's
+    modification time and size are unchanged. The cached data itself is returned, so callers must copy it before
+    mutating it.
+
+    :param cache: OrderedDict, the cache, mapping real paths to ((mtime in ns, size), data), most recently used last.
+    :param max_size: int, the number of files to keep in the cache.
+    :param path: str, the path to an existing file.
+    :param parse: callable, reads and parses the file at the given path.
+    :return: The parsed data.
+    """
+    real_path = os.path.realpath(path)
+    signature = file_signature(real_path)
+    entry = cache.get(real_path)
+    if entry is not None and entry[0] == signature:
+        cache.move_to_end(real_path)
+        return entry[1]
+
+    data = parse(real_path)
+    cache[real_path] = (signature, data)
+    cache.move_to_end(real_path)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+    return data
+
+
+def _parse_yml(path: str) -> Dict:
+    """
+    Reads and parses a .yml file.
+
+    :param path: str, the path to the file.
+    :return: dict, the parsed data.
+    """
+    with open(path, 'rb', buffering=_YAML_BUFFER_SIZE) as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _parse_json(path: str) -> Dict:
+    """
+    Reads and parses a JSON file, in one go rather than through the file object.
+
+    :param path: str, the path to the file.
+    :return: dict, the parsed data.
+    """
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+# Parsed YAML and JSON files keyed by real path, storing ((mtime in ns, size), data), most recently used last
+_YAML_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], dict]]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_JSON_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], dict]]" = OrderedDict()
+_JSON_CACHE_SIZE = 8
+
+
+def _load_yml(config_path: str) -> Dict:
+    """
+    Loads a .yml file, reusing the previously parsed data if the file's modification time and size are unchanged.
+
+    :param config_path: str, the path to an existing config file.
+    :return: dict, a copy of the loaded configuration data.
+    """
+    return copy.deepcopy(_load_cached(_YAML_CACHE, _YAML_CACHE_SIZE, config_path, _parse_yml))
+
+
+def read_json_cached(json_path: str) -> Dict:
+    """
+    Reads a JSON file, reusing the parsed data if the file's modification time and size are unchanged. The data is
+    shared between calls, so it must be copied before being mutated.
+
+    :param json_path: str, the path to the JSON file.
+    :return: dict, the parsed JSON data.
+    """
+    return _load_cached(_JSON_CACHE, _JSON_CACHE_SIZE, json_path, _parse_json)
+
+
 def open_yml_file(config_path: str) -> Dict:
     """
     Opens a config .yml file and returns the data. If the file does not exist, it will look
@@ -135,29 +273,34 @@ def open_yml_file(config_path: str) -> Dict:
     # print("Resource directory:", resource_dir)
     # print("*"*50)
 
-    if not os.path.isfile(os.path.normpath(config_path)):
+    config_path = normalise_path(config_path)
+    default_config_path = normalise_path(os.path.join(resource_dir, 'config.yml'))
+
+    if not os.path.isfile(config_path):
         # If the config file does not exist, look for the default config file
-        print(f"Could not find config file at {os.path.normpath(config_path)}")
-        if os.path.isfile(os.path.normpath(os.path.join(resource_dir, 'config.yml'))):
-            print(f"Using default config file at "
-                  f"{os.path.normpath(os.path.join(resource_dir, 'config.yml'))}")
-            config_path = os.path.normpath(os.path.join(resource_dir, 'config.yml'))
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+        print(f"Could not find config file at {config_path}")
+        if os.path.isfile(default_config_path):
+            print(f"Using default config file at {default_config_path}")
+            config_data = _load_yml(default_config_path)
         else:
             # If the default config file does not exist, create a new one
-            print(f"Could not find default config file at {os.path.normpath(os.path.join(resource_dir, 'config.yml'))}")
-            print(f"Creating a new default config file at "
-                  f"{os.path.normpath(os.path.join(resource_dir, 'config.yml'))}")
+            print(f"Could not find default config file at {default_config_path}")
+            print(f"Creating a new default config file at {default_config_path}")
             config_data = create_default_config()
     else:
         # Open the config file and load the data
-        with open(os.path.normpath(config_path), 'r') as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yml(config_path)
 
     return config_data
 
 
+# Formatters shared by every call to setup_logging
+_FILE_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%d/%m/%Y %H:%M:%S'
+)
+_CONSOLE_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%d/%m/%Y %H:%M:%S')
+
+
 def setup_logging(log_out_path: str) -> Tuple[logging.Logger, logging.Logger]:
     """
     Sets up the logging for the application. Creates two loggers: one for logging to a file and another for console
@@ -168,28 +311,31 @@ def setup_logging(log_out_path: str) -> Tuple[logging.Logger, logging.Logger]:
     :return: A tuple (file_logger, console_logger), where file_logger is configured to log to a file,
         and console_logger is configured for console output.
     """
-    full_log_file_path = os.path.normpath(os.path.expanduser(os.path.join(log_out_path, "speedy_iqa.log")))
-    os.makedirs(os.path.dirname(full_log_file_path), exist_ok=True)
+    full_log_file_path = normalise_path(os.path.join(log_out_path, "speedy_iqa.log"))
 
     # Configure logger for file output
     file_logger = logging.getLogger('fileLogger')
     file_logger.setLevel(logging.DEBUG)
     file_logger.propagate = False
-    fileHandler = FileHandler(full_log_file_path, mode='a')
-    fileHandler.setFormatter(logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%d/%m/%Y %H:%M:%S')
-    )
-    file_logger.addHandler(fileHandler)
+    # Repeat calls only swap the file handler if the log file has moved, so records are never written twice
+    if not any(getattr(handler, 'baseFilename', None) == full_log_file_path for handler in file_logger.handlers):
+        for handler in list(file_logger.handlers):
+            file_logger.removeHandler(handler)
+            handler.close()
+        os.makedirs(os.path.dirname(full_log_file_path), exist_ok=True)
+        # delay=True: the file is not opened until the first record is written
+        fileHandler = FileHandler(full_log_file_path, mode='a', delay=True)
+        fileHandler.setFormatter(_FILE_LOG_FORMATTER)
+        file_logger.addHandler(fileHandler)
 
     # Configure logger for console output
     console_logger = logging.getLogger('consoleLogger')
     console_logger.setLevel(logging.DEBUG)
     console_logger.propagate = False
-    consoleHandler = StreamHandler(sys.stdout)
-    consoleHandler.setFormatter(
-        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%d/%m/%Y %H:%M:%S')
-    )
-    console_logger.addHandler(consoleHandler)
+    if not console_logger.handlers:
+        consoleHandler = StreamHandler(sys.stdout)
+        consoleHandler.setFormatter(_CONSOLE_LOG_FORMATTER)
+        console_logger.addHandler(consoleHandler)
 
     return file_logger, console_logger
 
@@ -218,21 +364,37 @@ def bytescale(
     :rtype: np.ndarray
     """
 
-    arr = arr.astype(float)  # to ensure floating point division
-
-    # Clip to specified high/low values, if any
+    # Take the extrema from the raw input and fold the high/low clipping into them, so no
+    # clipped float copy of the whole image is needed just to find the range
+    min_val, max_val = float(np.min(arr)), float(np.max(arr))
     if low is not None:
-        arr = np.maximum(arr, low)
+        min_val, max_val = max(min_val, low), max(max_val, low)
     if high is not None:
-        arr = np.minimum(arr, high)
-
-    min_val, max_val = np.min(arr), np.max(arr)
+        min_val, max_val = min(min_val, high), min(max_val, high)
 
     if np.isclose(min_val, max_val):  # avoid division by zero
         return np.full_like(arr, a, dtype=np.uint8)
 
-    # Normalize between a and b
-    return (((b - a) * (arr - min_val) / (max_val - min_val)) + a).astype(np.uint8)
+    # Single float working buffer; clipping only matters if high/low narrowed the range
+    buf = arr.astype(np.float64, copy=True)
+    if low is not None or high is not None:
+        np.clip(buf, min_val, max_val, out=buf)
+
+    # Normalize between a and b in place, in the same order as (b - a) * (arr - min) / (max - min) + a. Multiplying
+    # by a precomputed reciprocal instead rounds whole numbers (e.g. max_val -> b) just below, and the uint8 cast
+    # then truncates them
+    np.subtract(buf, min_val, out=buf)
+    np.multiply(buf, b - a, out=buf)
+    np.divide(buf, max_val - min_val, out=buf)
+    np.add(buf, a, out=buf)
+
+    out = np.empty(buf.shape, dtype=np.uint8)
+    np.copyto(out, buf, casting='unsafe')
+    return out
+
+
+# Tri-state checkbox states, indexed by their stored integer value
+_CHECK_STATES = (Qt.CheckState.Unchecked, Qt.CheckState.PartiallyChecked, Qt.CheckState.Checked)
 
 
 def convert_to_checkstate(value: int) -> Qt.CheckState:
@@ -244,14 +406,10 @@ def convert_to_checkstate(value: int) -> Qt.CheckState:
     :return: The converted value.
     :rtype: Qt.CheckState
     """
-    if int(value) == 0:
-        return Qt.CheckState.Unchecked
-    elif int(value) == 1:
-        return Qt.CheckState.PartiallyChecked
-    elif int(value) == 2:
-        return Qt.CheckState.Checked
-    else:
-        raise("Invalid value for tri-state checkbox:", value)
+    index = int(value)
+    if not 0 <= index < len(_CHECK_STATES):
+        raise ValueError(f"Invalid value for tri-state checkbox: {value}")
+    return _CHECK_STATES[index]
 
 
 def create_icns(
@@ -260,18 +418,24 @@ def create_icns(
         sizes: Optional[Union[Tuple[int], List[int]]] = (16, 32, 64, 128, 256, 512, 1024)
 ):
     img = Image.open(png_path)
-    icon_sizes = []
+    icons_by_size = {}
 
-    for size in sizes:
+    # Work down from the largest size so each thumbnail is taken from the previous, smaller one
+    # rather than from the full-resolution source every time
+    current = img
+    for size in sorted(set(sizes), reverse=True):
         # Resize while maintaining aspect ratio (thumbnail method maintains aspect ratio)
-        copy = img.copy()
-        copy.thumbnail((size, size))
+        current = current.copy()
+        current.thumbnail((size, size), Image.Resampling.LANCZOS)
 
         # Create new image and paste the resized image into it, centering it
         new_image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        new_image.paste(copy, ((size - copy.width) // 2, (size - copy.height) // 2))
+        new_image.paste(current, ((size - current.width) // 2, (size - current.height) // 2))
+
+        icons_by_size[size] = new_image
 
-        icon_sizes.append(new_image)
+    # Keep the images in the order the sizes were requested
+    icon_sizes = [icons_by_size[size] for size in sizes]
 
     if icns_path.endswith('.icns'):
         icns_path = icns_path[:-5]
@@ -280,29 +444,104 @@ def create_icns(
     icon_sizes[0].save(f'{icns_path}.icns', format='ICNS', append_images=icon_sizes[1:])
 
 
+# File extensions recognised as images, matched case-insensitively wherever image files are looked for
+IMAGE_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'tif', 'dcm', 'dicom',)
+
+
+@lru_cache(maxsize=16)
+def _extension_pattern(extensions: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compiles a single case-insensitive regex matching file names that end in any of the given extensions.
+
+    :param extensions: The file extensions, without the leading dot.
+    :type extensions: Tuple[str, ...]
+    :return: The compiled pattern.
+    :rtype: re.Pattern
+    """
+    return re.compile(r'\.(?:' + '|'.join(map(re.escape, extensions)) + r')\Z', re.IGNORECASE)
+
+
+def is_image_filename(name: str, extensions: Collection[str] = IMAGE_EXTENSIONS) -> bool:
+    """
+    Check whether a file name ends in one of the image extensions, ignoring case.
+
+    :param name: The file name.
+    :param extensions: The file extensions to consider as image files.
+    :return: True if the name has an image extension, False otherwise.
+    """
+    return _extension_pattern(tuple(extensions)).search(name) is not None
+
+
+def iter_relative_image_paths(
+        base_path: str,
+        extensions: Collection[str] = IMAGE_EXTENSIONS
+) -> Iterator[str]:
+    """
+    Lazily yield the relative paths of the image files in a given directory, searching recursively.
+
+    :param base_path: The path to the directory to search.
+    :param extensions: A list of file extensions to consider as image files.
+    :return: An iterator over relative paths pointing to the image files.
+    """
+    pattern = _extension_pattern(tuple(extensions))
+    # The real paths of each pending directory's ancestors, so symlink loops can be cut off
+    ancestors = {base_path: frozenset()}
+    # Walk the tree once, following symlinked directories and skipping hidden entries as the recursive glob did
+    for root, dirs, files in os.walk(base_path, followlinks=True):
+        real_root = os.path.realpath(root)
+        root_ancestors = ancestors.pop(root, frozenset())
+        if real_root in root_ancestors:
+            # A symlink back to a directory above this one
+            dirs[:] = []
+            continue
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        below = root_ancestors | {real_root}
+        for d in dirs:
+            ancestors[os.path.join(root, d)] = below
+        for name in files:
+            if not name.startswith('.') and pattern.search(name):
+                yield os.path.relpath(os.path.join(root, name), start=base_path)
+
+
 def find_relative_image_path(
         base_path: str,
-        extensions: Collection[str] = ('png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'tif', 'dcm', 'dicom',)
+        extensions: Collection[str] = IMAGE_EXTENSIONS
 ) -> List[str]:
     """
     Recursively find all image files in a given directory and return their relative paths.
 
     :param base_path: The path to the directory to search.
-    :param extensions: A list of file extensions to consider as image files. Default is ['png', 'jpg', 'jpeg', 'gif',
-        'bmp', 'tiff', 'tif', 'dcm', 'dicom',].
+    :param extensions: A list of file extensions to consider as image files. Default is IMAGE_EXTENSIONS.
     :return: A list of relative paths pointing to the image files.
     """
-    all_images = []
-    for extension in extensions:
-        for image_path in glob.glob(f"{base_path}/**/*.{extension}", recursive=True):
-            relative_path = os.path.relpath(image_path, start=base_path)
-            all_images.append(relative_path)
+    return list(iter_relative_image_paths(base_path, extensions))
 
-    return all_images
 
+def contains_image_file(base_path: str) -> bool:
+    """
+    Check whether a directory contains at least one image file, stopping at the first match.
 
-def invert_grayscale(image):
-    return np.max(image) + np.min(image) - image
+    :param base_path: The path to the directory to search.
+    :return: True if an image file was found, False otherwise.
+    """
+    return next(iter_relative_image_paths(base_path), None) is not None
+
+
+def invert_grayscale(image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Invert a greyscale image about its own intensity range, e.g. to display MONOCHROME1 images.
+
+    :param image: The image to invert.
+    :type image: np.ndarray
+    :param out: Optional array to write the result into; may be the input itself to invert in place.
+    :type out: np.ndarray
+    :return: The inverted image.
+    :rtype: np.ndarray
+    """
+    if out is None:
+        out = np.empty_like(image)
+    # Single subtraction straight into the output rather than a broadcast temporary
+    return np.subtract(np.max(image) + np.min(image), image, out=out)
 
 
 def expand_dict_column(df, column_name):
@@ -314,22 +553,16 @@ def expand_dict_column(df, column_name):
     :return: DataFrame with expanded columns.
     :rtype: pandas.DataFrame
     """
-    # Use apply to create a new DataFrame with the expanded columns
-    expanded_df = df[column_name].apply(pd.Series)
-
-    # Concatenate the expanded DataFrame with the original DataFrame
-    result_df = pd.concat([df, expanded_df], axis=1)
-
-    # Drop the original dictionary column
-    result_df.drop(column_name, axis=1, inplace=True)
-
-    new_columns = expanded_df.columns
+    # Build the expanded columns in a single construction rather than a Series per row
+    expanded_df = pd.DataFrame(
+        [value if isinstance(value, dict) else {} for value in df[column_name].tolist()], index=df.index
+    )
+    expanded_df.columns = [str(col).lower().replace(" ", "_") for col in expanded_df.columns]
 
-    for col in new_columns:
-        result_df = result_df.rename(columns={col: col.lower().replace(" ", "_")})
-    new_columns = [col.lower().replace(" ", "_") for col in new_columns]
+    # Swap the original dictionary column for the expanded ones
+    result_df = pd.concat([df.drop(columns=[column_name]), expanded_df], axis=1)
 
-    return result_df, new_columns
+    return result_df, list(expanded_df.columns)
 
 
 def make_column_categorical(df, column_name):
@@ -341,15 +574,17 @@ def make_column_categorical(df, column_name):
     :return: DataFrame with the specified column as categorical.
     :rtype: pandas.DataFrame
     """
-    # Define the bin edges for categorization
-    bin_edges = [0, 1, 2, 3, 4, np.inf]
+    # Interior edges of the bins [0, 1), [1, 2), [2, 3), [3, 4) and [4, inf)
+    bin_edges = np.array([1, 2, 3, 4])
 
     # Define labels for each category
     labels = ['1', '2', '3', '4', 'Blank']
 
-    # Use pd.cut() to categorize the values
-    df[column_name] = pd.cut(df[column_name], bins=bin_edges, labels=labels, right=False)
+    # Bin the values directly rather than through pd.cut's IntervalIndex; values outside [0, inf) and NaNs get
+    # the missing-value code, as they did with pd.cut
+    values = df[column_name].to_numpy(dtype=float)
+    codes = np.searchsorted(bin_edges, values, side='right').astype(np.int8)
+    codes[~((values >= 0) & (values < np.inf))] = -1
+    df[column_name] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
 
     return df
-
-
@@ -11,36 +11,151 @@ Classes:
     - SetupWindow: A custom QDialog for displaying the setup window when the application is first launched to allow
                             the user to select the image directory and decide whether to continue previous progress by
                              loading an existing json file.
+    - ImagePreloader: A QRunnable that decodes the dialog logos away from the GUI thread.
 
 Functions:
     - load_json_filenames_findings: Load the filenames and findings from a json file.
+    - preload_images: Start decoding the dialog logos in the background.
 """
 
 import os
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 from PyQt6.QtWidgets import *
-from typing import Optional, List
-import sys
+from typing import Optional, List, Tuple
 import json
+import threading
 from qt_material import get_theme
 
-from speedy_qc.utils import ConnectionManager
+from speedy_qc.utils import ConnectionManager, resource_dir, is_image_filename
+
+# MIT licence text shown in the About dialog's details
+_LICENSE_TEXT = (
+    "Permission is hereby granted, free of charge, to any person obtaining a copy of "
+    "this software and associated documentation files (the 'Software'), to deal in "
+    "the Software without restriction, including without limitation the rights to "
+    "use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of "
+    "the Software, and to permit persons to whom the Software is furnished to do so, "
+    "subject to the following conditions:\n\nThe above copyright notice and this "
+    "permission notice shall be included in all copies or substantial portions of the "
+    "Software.\n\nTHE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, "
+    "EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF "
+    "MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO "
+    "EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, "
+    "DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, "
+    "ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER "
+    "DEALINGS IN THE SOFTWARE."
+)
+
+# Error messages shown by SetupWindow
+_JSON_IMAGE_INCOMPATIBILITY_TEXT = (
+    "JSON - IMAGE FOLDER CONFLICT!\n\n"
+    "The selected json file has image files which are not present in the selected image directory.\n\n"
+    "Please select a new json file or image directory. Alternatively, start again and select a new config file. "
+)
+_NO_IMAGE_TEXT = (
+    "NO IMAGE DIRECTORY SELECTED!\n\n"
+    "Please select an image directory or start again and select a new config file. "
+)
+
+# Logo images shown by the dialogs, decoded ahead of time by preload_images
+_LOGO_PATHS = (
+    os.path.normpath(os.path.join(resource_dir, 'assets/3x/white_panel@3x.png')),
+    os.path.normpath(os.path.join(resource_dir, 'assets/2x/white_panel@2x.png')),
+)
+
+# Images decoded off the GUI thread, waiting to be converted to pixmaps on first use, and the paths that already
+# have a pixmap (so a preload that finishes late is dropped rather than held forever). Both are guarded by the lock,
+# as QPixmapCache itself can only be used from the GUI thread
+_PRELOADED_IMAGES = {}
+_PIXMAP_PATHS = set()
+_PRELOAD_LOCK = threading.Lock()
+
+
+class ImagePreloader(QRunnable):
+    """
+    A QRunnable that decodes image files into QImages away from the GUI thread. QPixmaps can only be created on the
+    GUI thread, so the conversion is left to _cached_pixmap.
 
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc', 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc', 'speedy_qc')
-else:
-    raise (FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
+    :param paths: The paths of the image files to decode.
+    :type paths: Tuple[str, ...]
+    """
+    def __init__(self, paths: Tuple[str, ...]):
+        super().__init__()
+        self.paths = paths
+
+    def run(self):
+        """
+        Decodes each image and stores it for _cached_pixmap to pick up.
+        """
+        for path in self.paths:
+            with _PRELOAD_LOCK:
+                if path in _PIXMAP_PATHS:
+                    continue
+            image = QImage(path)
+            if image.isNull():
+                continue
+            with _PRELOAD_LOCK:
+                # The GUI thread may have loaded the file itself while this one was decoding
+                if path not in _PIXMAP_PATHS:
+                    _PRELOADED_IMAGES[path] = image
+
+
+def preload_images():
+    """
+    Starts decoding the dialog logos on the global thread pool, so the PNG decode overlaps with building the first
+    dialog. Should be called once the QApplication exists.
+    """
+    QThreadPool.globalInstance().start(ImagePreloader(_LOGO_PATHS))
+
+
+def _cached_pixmap(path: str) -> QPixmap:
+    """
+    Returns the pixmap for an image file, keeping it in the QPixmapCache so the file is only decoded once. If the
+    image has already been decoded by preload_images, only the cheap QImage to QPixmap conversion is done here.
+
+    :param path: The path to the image file.
+    :type path: str
+    :return: The pixmap.
+    :rtype: QPixmap
+    """
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        with _PRELOAD_LOCK:
+            image = _PRELOADED_IMAGES.pop(path, None)
+            _PIXMAP_PATHS.add(path)
+        pixmap = QPixmap.fromImage(image) if image is not None else QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+
+def _scaled_pixmap(
+        path: str,
+        width: int,
+        height: int,
+        mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation
+) -> QPixmap:
+    """
+    Returns an image file's pixmap scaled to fit within the given size, keeping the aspect ratio. The scaled pixmap
+    is kept in the QPixmapCache so the resample is only done once per size.
+
+    :param path: The path to the image file.
+    :type path: str
+    :param width: The maximum width of the scaled pixmap.
+    :type width: int
+    :param height: The maximum height of the scaled pixmap.
+    :type height: int
+    :param mode: The transformation used for the resample.
+    :type mode: Qt.TransformationMode
+    :return: The scaled pixmap.
+    :rtype: QPixmap
+    """
+    key = f"{path}:{width}x{height}:{mode.value}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _cached_pixmap(path).scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class AboutMessageBox(QDialog):
@@ -71,7 +186,7 @@ class AboutMessageBox(QDialog):
 
         # Add the icon to the left side of the message box using a QLabel
         path = os.path.normpath(os.path.join(resource_dir, 'assets/3x/white_panel@3x.png'))
-        grey_logo = QPixmap(path).scaled(320, 320, Qt.AspectRatioMode.KeepAspectRatio)
+        grey_logo = _scaled_pixmap(path, 320, 320)
         icon_label = QLabel()
         icon_label.setPixmap(grey_logo)
         left_layout.addStretch(1)
@@ -105,22 +220,7 @@ class AboutMessageBox(QDialog):
         # Create a QPlainTextEdit for the licence information
         self.detailed_info = QTextEdit()
         self.detailed_info.setReadOnly(True)
-        self.detailed_info.setText(
-            "Permission is hereby granted, free of charge, to any person obtaining a copy of "
-            "this software and associated documentation files (the 'Software'), to deal in "
-            "the Software without restriction, including without limitation the rights to "
-            "use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of "
-            "the Software, and to permit persons to whom the Software is furnished to do so, "
-            "subject to the following conditions:\n\nThe above copyright notice and this "
-            "permission notice shall be included in all copies or substantial portions of the "
-            "Software.\n\nTHE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, "
-            "EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF "
-            "MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO "
-            "EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, "
-            "DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, "
-            "ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER "
-            "DEALINGS IN THE SOFTWARE."
-        )
+        self.detailed_info.setText(_LICENSE_TEXT)
         self.detailed_info.setFixedHeight(300)
         self.detailed_info.setFixedWidth(300)
         self.detailed_info.hide()  # Hide the detailed information by default
@@ -190,7 +290,7 @@ class LoadMessageBox(QDialog):
 
         # path = pkg_resources.resource_filename('speedy_qc', 'assets/3x/white@3x.png')
         path = os.path.normpath(os.path.join(resource_dir, 'assets/3x/white_panel@3x.png'))
-        logo = QPixmap(path).scaled(320, 320, Qt.AspectRatioMode.KeepAspectRatio)
+        logo = _scaled_pixmap(path, 320, 320)
 
         # Create a QLabel to display the logo
         icon_label = QLabel()
@@ -371,7 +471,7 @@ class SetupWindow(QDialog):
         logo_layout.addItem(spacer)
 
         path = os.path.normpath(os.path.join(resource_dir, 'assets/2x/white_panel@2x.png'))
-        logo = QPixmap(path).scaled(150, 150, Qt.AspectRatioMode.KeepAspectRatio)
+        logo = _scaled_pixmap(path, 150, 150)
         icon_label = QLabel()
         icon_label.setPixmap(logo)
         logo_layout.addWidget(icon_label)
@@ -500,11 +600,7 @@ class SetupWindow(QDialog):
         """
         QMessageBox.critical(self,
                              "Error",
-                             f"JSON - IMAGE FOLDER CONFLICT!\n\n"
-                             f"The selected json file has image files which are not present in the selected image "
-                             f"directory.\n\n"
-                             f"Please select a new json file or image directory. Alternatively, start again and select "
-                             f"a new config file. ",
+                             _JSON_IMAGE_INCOMPATIBILITY_TEXT,
                              QMessageBox.StandardButton.Ok,
                              defaultButton=QMessageBox.StandardButton.Ok)
 
@@ -514,8 +610,7 @@ class SetupWindow(QDialog):
         """
         QMessageBox.critical(self,
                              "Error",
-                             f"NO IMAGE DIRECTORY SELECTED!\n\n"
-                             f"Please select an image directory or start again and select a new config file. ",
+                             _NO_IMAGE_TEXT,
                              QMessageBox.StandardButton.Ok,
                              defaultButton=QMessageBox.StandardButton.Ok)
 
@@ -529,9 +624,8 @@ class SetupWindow(QDialog):
         :rtype: bool
         """
         if os.path.isdir(self.folder_label.text()):
-            imgs = sorted([f for f in os.listdir(self.folder_label.text()) if f.endswith((
-                    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif', '.dcm', '.dicom',
-                ))])
+            with os.scandir(self.folder_label.text()) as entries:
+                imgs = {entry.name for entry in entries if is_image_filename(entry.name) and entry.is_file()}
 
             # Get list of dcms in json
             for file in filenames:
@@ -19,23 +19,9 @@ from PyQt6.QtWidgets import *
 import yaml
 import os
 from qt_material import apply_stylesheet, get_theme
-import sys
 from math import ceil
 
-from speedy_qc.utils import open_yml_file, setup_logging, ConnectionManager
-
-if hasattr(sys, '_MEIPASS'):
-    # This is a py2app executable
-    resource_dir = sys._MEIPASS
-elif 'main.py' in os.listdir(os.path.dirname(os.path.realpath(__file__))):
-    resource_dir = os.path.dirname(os.path.realpath(__file__))
-elif 'main.py' in os.listdir(os.path.dirname(os.path.abspath("__main__"))):
-    # This is a regular Python script
-    resource_dir = os.path.dirname(os.path.abspath("__main__"))
-elif 'main.py' in os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc'):
-    resource_dir = os.path.join(os.path.dirname(os.path.abspath("__main__")), 'speedy_qc')
-else:
-    raise(FileNotFoundError(f"Resource directory not found from {os.path.dirname(os.path.abspath('__main__'))}"))
+from speedy_qc.utils import open_yml_file, setup_logging, ConnectionManager, SafeDumper, resource_dir
 
 
 class RadioButtonPage(QWizardPage):
@@ -235,7 +221,7 @@ class RadioButtonGroupDialog(QDialog):
         """
         The labels of the radio buttons.
         """
-        return self.labelsInput.toPlainText().split("\n")
+        return [line.strip() for line in self.labelsInput.toPlainText().splitlines() if line.strip()]
 
 
 class ConfigurationWizard(QWizard):
@@ -559,9 +545,10 @@ class ConfigurationWizard(QWizard):
 
         # Create QComboBox for the list of available .yml files
         self.config_files_combobox = QComboBox()
-        for file in os.listdir(resource_dir):
-            if file.endswith('.yml'):
-                self.config_files_combobox.addItem(file)
+        with os.scandir(resource_dir) as entries:
+            self.config_files_combobox.addItems(
+                [entry.name for entry in entries if entry.name.endswith('.yml') and entry.is_file()]
+            )
 
         last_used_file = self.settings.value("last_config_file", "config.yml")
         index = self.config_files_combobox.findText(last_used_file)
@@ -648,16 +635,17 @@ class ConfigurationWizard(QWizard):
         self.config_data['backup_interval'] = self.backup_int_spinbox.value()
         self.config_data['backup_dir'] = os.path.normpath(os.path.abspath(self.backup_dir_edit.text()))
         self.config_data['log_dir'] = os.path.normpath(os.path.abspath(self.log_dir_edit.text()))
-        print("Log Dir: ",  self.config_data['log_dir'])
+
+        logger, console_msg = setup_logging(self.config_data['log_dir'])
+        logger.debug("Log Dir: %s", self.config_data['log_dir'])
 
         save_path = os.path.join(resource_dir, filename)
 
         # Save the config file
         with open(save_path, 'w') as f:
-            yaml.dump(self.config_data, f)
+            yaml.dump(self.config_data, f, Dumper=SafeDumper)
 
         # Makes a log of the new configuration
-        logger, console_msg = setup_logging(self.config_data['log_dir'])
         logger.info(f"Configuration saved to {save_path}")
 
         # Inform the user that the configuration has been saved